@@ -6,8 +6,14 @@ with Waveshare 2.13" V4 Display
 
 import sys
 import os
+import math
+import select
+import textwrap
 import time
 import json
+import queue
+import atexit
+import functools
 from datetime import datetime
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
@@ -30,6 +36,84 @@ except ImportError:
     print("Warning: Waveshare library not found. Running in demo mode.")
     epd2in13_V4 = None
 
+# numpy is optional - used for fast framebuffer packing when available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is optional - a C-level JSON codec, noticeably faster than the
+# stdlib json module on the Pi
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Resolve the font files once at import; on a system without the
+# DejaVu fonts this avoids ever taking the truetype exception path
+_BOLD_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+_REGULAR_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+if not os.path.exists(_BOLD_FONT):
+    _BOLD_FONT = None
+if not os.path.exists(_REGULAR_FONT):
+    _REGULAR_FONT = None
+
+_PY_VERSION = sys.version.split()[0]
+
+
+def _atomic_write_json(path, obj):
+    """Serialize compactly and write via a temp file + atomic rename"""
+    if orjson is not None:
+        data = orjson.dumps(obj)
+    else:
+        data = json.dumps(obj, separators=(',', ':')).encode()
+
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb', buffering=1 << 16) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read_json(path):
+    """Read and parse a JSON file (orjson when available)"""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _data_dir():
+    """Create the shared data directory once and return its Path"""
+    path = Path.home() / "eink_notes"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _font(path, size):
+    """Load a font once and reuse it (opening the TTF per draw is slow)"""
+    if path is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(path, size)
+    except:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_tile(text, path, size, fill, bg):
+    """Render a line of text once into a small reusable 1-bit tile"""
+    fnt = _font(path, size)
+    probe = ImageDraw.Draw(Image.new('1', (1, 1)))
+    bbox = probe.textbbox((0, 0), text, font=fnt)
+    tile = Image.new('1', (max(bbox[2], 1), max(bbox[3], 1)), bg)
+    ImageDraw.Draw(tile).text((0, 0), text, font=fnt, fill=fill)
+    return tile
+
 
 class Display:
     """Handle e-ink display operations"""
@@ -39,6 +123,11 @@ class Display:
         self.epd = None
         self.demo_mode = epd2in13_V4 is None
         self.settings_manager = settings_manager
+
+        # get_colors is on every drawing path, so the tuple is cached and
+        # invalidated only when dark_mode actually changes
+        self._colors_cache = None
+        settings_manager.add_observer(self._on_setting_change)
         
         if not self.demo_mode:
             try:
@@ -48,29 +137,98 @@ class Display:
             except Exception as e:
                 print(f"Display init error: {e}. Running in demo mode.")
                 self.demo_mode = True
+
+        # Panel refreshes are slow (up to ~2s for a full refresh), so
+        # flushing happens on a worker thread. The queue holds a single
+        # frame; a newer frame replaces a queued-but-unstarted one.
+        self._render_queue = queue.Queue(maxsize=1)
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._render_thread.start()
+
+        # Demo-mode preview throttling state
+        self._last_png_hash = None
+        self._last_png_time = 0.0
+        # Hash of the frame currently on the panel, for skipping
+        # redundant partial refreshes
+        self._last_frame_hash = None
+
+    def _render_loop(self):
+        """Background worker that pushes queued frames to the panel"""
+        while True:
+            image, partial = self._render_queue.get()
+            try:
+                self._do_show(image, partial)
+            finally:
+                self._render_queue.task_done()
     
+    def _on_setting_change(self, key, value):
+        """Settings observer: drop cached colors when dark mode flips"""
+        if key == 'dark_mode':
+            self._colors_cache = None
+
     def get_colors(self):
         """Get foreground and background colors based on dark mode setting"""
-        dark_mode = self.settings_manager.get_setting('dark_mode', True)
-        if dark_mode:
-            return 255, 0  # white foreground, black background
-        else:
-            return 0, 255  # black foreground, white background
+        if self._colors_cache is None:
+            dark_mode = self.settings_manager.get_setting('dark_mode', True)
+            if dark_mode:
+                self._colors_cache = (255, 0)  # white foreground, black background
+            else:
+                self._colors_cache = (0, 255)  # black foreground, white background
+        return self._colors_cache
     
-    def show(self, image, partial=False):
-        """Display image on e-ink screen"""
+    def _fast_getbuffer(self, image):
+        """Pack a landscape 1-bit image into the panel byte format"""
+        if np is None or image.size != (self.width, self.height):
+            return self.epd.getbuffer(image)
+
+        # Rotate to the panel's portrait orientation the same way the
+        # Waveshare driver does, then pack bits MSB-first in one numpy
+        # pass (packbits pads partial row bytes with 0, matching the
+        # driver's row padding)
+        arr = np.asarray(image.rotate(90, expand=True), dtype=np.uint8)
+        return bytearray(np.packbits(arr, axis=1).tobytes())
+
+    def _do_show(self, image, partial):
+        """Actually push an image to the panel (runs on the worker)"""
         if self.demo_mode:
-            image.save('/tmp/eink_preview.png')
+            # Skip the PNG encode + SD-card write for unchanged frames,
+            # and rate-limit bursts (e.g. per-keystroke repaints)
+            frame_hash = hash(image.tobytes())
+            now = time.monotonic()
+            if frame_hash == self._last_png_hash or now - self._last_png_time < 0.25:
+                return
+            image.save('/tmp/eink_preview.png', compress_level=1)
             print("Demo mode: Image saved to /tmp/eink_preview.png")
+            self._last_png_hash = frame_hash
+            self._last_png_time = now
             return
-        
+
+        # Identical frame already on the panel: skip the buffer pack and
+        # SPI transfer entirely. Full refreshes still go through so a
+        # requested anti-ghosting flash is never dropped.
+        frame_hash = hash(image.tobytes())
+        if partial and frame_hash == self._last_frame_hash:
+            return
+
         try:
             if partial:
-                self.epd.displayPartial(self.epd.getbuffer(image))
+                self.epd.displayPartial(self._fast_getbuffer(image))
             else:
-                self.epd.display(self.epd.getbuffer(image))
+                self.epd.display(self._fast_getbuffer(image))
+            self._last_frame_hash = frame_hash
         except Exception as e:
             print(f"Display error: {e}")
+
+    def show(self, image, partial=False):
+        """Queue an image for display without blocking the UI"""
+        # Drop a stale frame that hasn't started flushing yet - rapid
+        # repaints coalesce into the newest one
+        try:
+            self._render_queue.get_nowait()
+            self._render_queue.task_done()
+        except queue.Empty:
+            pass
+        self._render_queue.put((image.copy(), partial))
     
     def clear(self):
         """Clear the display"""
@@ -78,72 +236,107 @@ class Display:
             self.epd.Clear(0xFF)
     
     def sleep(self):
-        """Put display to sleep"""
+        """Put display to sleep (after any queued frame has flushed)"""
         if not self.demo_mode:
+            self._render_queue.join()
             self.epd.sleep()
 
 
 class KeyboardInput:
     """Handle keyboard input in non-blocking way"""
     def __init__(self):
-        self.key_buffer = []
+        self.key_queue = queue.Queue()
         self.running = True
+        # Pipe used to wake the reader thread for shutdown
+        self._wake_r, self._wake_w = os.pipe()
         self.thread = threading.Thread(target=self._read_keys, daemon=True)
         self.thread.start()
-    
+
     def _read_keys(self):
         """Background thread to read keyboard input"""
         old_settings = termios.tcgetattr(sys.stdin)
         try:
             tty.setcbreak(sys.stdin.fileno())
             while self.running:
-                if sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
+                # Block in the kernel until real input arrives (or stop()
+                # writes to the wake pipe) instead of polling at 10Hz
+                ready = select.select([sys.stdin, self._wake_r], [], [])[0]
+                if self._wake_r in ready:
+                    break
+                if sys.stdin in ready:
                     char = sys.stdin.read(1)
-                    
+
                     # Handle escape sequences (arrow keys, etc)
                     if char == '\x1b':
                         next_chars = sys.stdin.read(2)
                         if next_chars == '[A':
-                            self.key_buffer.append('UP')
+                            self.key_queue.put('UP')
                         elif next_chars == '[B':
-                            self.key_buffer.append('DOWN')
+                            self.key_queue.put('DOWN')
                         elif next_chars == '[C':
-                            self.key_buffer.append('RIGHT')
+                            self.key_queue.put('RIGHT')
                         elif next_chars == '[D':
-                            self.key_buffer.append('LEFT')
+                            self.key_queue.put('LEFT')
                         else:
-                            self.key_buffer.append('ESC')
+                            self.key_queue.put('ESC')
                     elif char == '\r' or char == '\n':
-                        self.key_buffer.append('ENTER')
+                        self.key_queue.put('ENTER')
                     elif char == '\x7f':  # Backspace
-                        self.key_buffer.append('BACKSPACE')
+                        self.key_queue.put('BACKSPACE')
                     else:
-                        self.key_buffer.append(char)
+                        self.key_queue.put(char)
         finally:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
     
     def get_key(self):
-        """Get next key from buffer"""
-        if self.key_buffer:
-            return self.key_buffer.pop(0)
-        return None
-    
+        """Get next key without blocking, or None if none pending"""
+        try:
+            return self.key_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def wait_key(self, timeout=None):
+        """Block until a key arrives (or the timeout expires)"""
+        try:
+            return self.key_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def drain_keys(self):
+        """Pop every key currently queued without blocking"""
+        keys = []
+        while True:
+            try:
+                keys.append(self.key_queue.get_nowait())
+            except queue.Empty:
+                return keys
+
     def stop(self):
         """Stop keyboard reading thread"""
         self.running = False
-
-
-# Import select for keyboard reading
-import select
+        os.write(self._wake_w, b'x')
 
 
 class SettingsManager:
     """Manage application settings"""
     def __init__(self):
-        self.settings_dir = Path.home() / "eink_notes"
-        self.settings_dir.mkdir(exist_ok=True)
+        self.settings_dir = _data_dir()
         self.settings_file = self.settings_dir / "settings.json"
         self.settings = self._load_settings()
+
+        # Writes are debounced so flipping several toggles in a row
+        # costs one disk write instead of one per toggle
+        self._flush_timer = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush)
+
+        # Callbacks invoked with (key, value) when a setting changes, so
+        # cached values derived from settings can be invalidated
+        self._observers = []
+
+    def add_observer(self, callback):
+        """Register a callback notified on every setting change"""
+        self._observers.append(callback)
     
     def _load_settings(self):
         """Load settings from file"""
@@ -159,9 +352,7 @@ class SettingsManager:
         
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    loaded = json.load(f)
-                    defaults.update(loaded)
+                defaults.update(_read_json(self.settings_file))
             except:
                 pass
         
@@ -169,17 +360,37 @@ class SettingsManager:
     
     def _save_settings(self):
         """Save settings to file"""
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        _atomic_write_json(self.settings_file, self.settings)
     
     def get_setting(self, key, default=None):
         """Get a setting value"""
         return self.settings.get(key, default)
     
     def set_setting(self, key, value):
-        """Set a setting value"""
+        """Set a setting value (written to disk after a short debounce)"""
         self.settings[key] = value
+        for callback in self._observers:
+            callback(key, value)
+        with self._flush_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(1.0, self._flush_timed)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_timed(self):
+        """Timer callback: write the batched changes"""
+        with self._flush_lock:
+            self._flush_timer = None
         self._save_settings()
+
+    def flush(self):
+        """Write any pending settings change to disk immediately"""
+        with self._flush_lock:
+            timer = self._flush_timer
+            self._flush_timer = None
+        if timer is not None:
+            timer.cancel()
+            self._save_settings()
     
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
@@ -192,69 +403,209 @@ class SettingsManager:
             'show_seconds': False,
             'zip_code': ''
         }
+        for callback in self._observers:
+            callback('dark_mode', False)
         self._save_settings()
 
 
 class NotesManager:
     """Manage notes storage and retrieval"""
     def __init__(self):
-        self.notes_dir = Path.home() / "eink_notes"
-        self.notes_dir.mkdir(exist_ok=True)
-        self.notes_file = self.notes_dir / "notes.json"
-        self.notes = self._load_notes()
-    
+        self.notes_dir = _data_dir()
+        # One file per note: an edit or delete rewrites a single small
+        # file instead of the whole corpus
+        self.notes_path = self.notes_dir / "notes"
+        self.notes_path.mkdir(exist_ok=True)
+        # Compact index of id/title/created - note content stays on disk
+        # until a note is actually opened
+        self.index_file = self.notes_path / "index.json"
+        self.legacy_file = self.notes_dir / "notes.json"
+
+        self.notes, self._next_id = self._load_notes()
+        self._refresh_caches()
+
+        # Saves run on a background thread so note edits don't block on
+        # the SD card
+        self._save_queue = queue.Queue()
+        self._save_thread = threading.Thread(target=self._save_loop, daemon=True)
+        self._save_thread.start()
+
+    def _note_file(self, note_id):
+        """Path of the per-note file for an id"""
+        return self.notes_path / f"{note_id:06d}.json"
+
     def _load_notes(self):
-        """Load notes from file"""
-        if self.notes_file.exists():
+        """Load the note index; content is read lazily in get_note"""
+        if self.index_file.exists():
             try:
-                with open(self.notes_file, 'r') as f:
-                    return json.load(f)
+                loaded = _read_json(self.index_file)
+                notes = loaded.get('notes', [])
+                next_id = loaded.get('next_id', 1)
+                notes.sort(key=lambda n: n['id'])
+                next_id = max([next_id] + [n['id'] + 1 for n in notes])
+                return notes, next_id
             except:
-                return []
-        return []
-    
-    def _save_notes(self):
-        """Save notes to file"""
-        with open(self.notes_file, 'w') as f:
-            json.dump(self.notes, f, indent=2)
-    
+                pass
+
+        # No (readable) index: scan the per-note files, migrating any
+        # old monolithic notes.json first
+        notes = []
+        for path in sorted(self.notes_path.glob('[0-9]*.json')):
+            if path == self.index_file:
+                continue
+            try:
+                notes.append(_read_json(path))
+            except:
+                continue
+
+        next_id = 1
+        if not notes and self.legacy_file.exists():
+            notes, next_id = self._migrate_legacy(next_id)
+
+        notes.sort(key=lambda n: n['id'])
+        next_id = max([next_id] + [n['id'] + 1 for n in notes])
+
+        # Write the rebuilt index synchronously (the background writer
+        # isn't running yet during __init__)
+        self._next_id = next_id
+        self.notes = notes
+        _atomic_write_json(self.index_file, self._index_payload())
+        return notes, next_id
+
+    def _migrate_legacy(self, next_id):
+        """Split an old monolithic notes.json into per-note files"""
+        try:
+            loaded = _read_json(self.legacy_file)
+        except:
+            loaded = None
+
+        if isinstance(loaded, dict):
+            notes = loaded.get('notes', [])
+            next_id = max(next_id, loaded.get('next_id', 1))
+        elif isinstance(loaded, list):
+            notes = loaded
+        else:
+            notes = []
+
+        for note in notes:
+            _atomic_write_json(self._note_file(note['id']), note)
+        try:
+            self.legacy_file.unlink()
+        except OSError:
+            pass
+
+        return notes, next_id
+
+    def _refresh_caches(self):
+        """Rebuild the id index and list display cache"""
+        self._by_id = {n['id']: n for n in self.notes}
+        self._rebuild_display_cache()
+
+    def _index_payload(self):
+        """Compact index entries - everything the list view needs"""
+        return {'next_id': self._next_id,
+                'notes': [{'id': n['id'], 'title': n['title'],
+                           'created': n.get('created', '')} for n in self.notes]}
+
+    def _save_index(self):
+        """Queue a write of the note index"""
+        self._enqueue_write(self.index_file, self._index_payload())
+
+    def _enqueue_write(self, path, obj):
+        """Queue a file write (or, with obj=None, a delete)"""
+        self._save_queue.put((path, obj))
+
+    def _save_loop(self):
+        """Background worker that performs queued file writes"""
+        while True:
+            path, obj = self._save_queue.get()
+            try:
+                # A failed write (full/read-only SD card) must not kill
+                # the worker: log it and keep draining, or flush() would
+                # hang on shutdown waiting for the dropped item
+                if obj is None:
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                else:
+                    _atomic_write_json(path, obj)
+            except Exception as e:
+                print(f"Note save error ({path}): {e}")
+            finally:
+                self._save_queue.task_done()
+
+    def flush(self):
+        """Block until any pending save has reached disk"""
+        self._save_queue.join()
+
+    def _rebuild_display_cache(self):
+        """Pre-truncate the note titles shown in the list view"""
+        titles = []
+        for i, note in enumerate(self.notes):
+            title = note['title']
+            if len(title) > 25:
+                title = title[:22] + "..."
+            titles.append(f"{i+1}. {title}")
+        self.display_titles = titles
+
     def create_note(self, title, content):
         """Create a new note"""
         note = {
-            'id': len(self.notes) + 1,
+            'id': self._next_id,
             'title': title,
             'content': content,
             'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
+        self._next_id += 1
         self.notes.append(note)
-        self._save_notes()
+        self._refresh_caches()
+        self._enqueue_write(self._note_file(note['id']), dict(note))
+        self._save_index()
         return note
-    
+
     def get_notes(self):
         """Get all notes"""
         return self.notes
-    
+
     def get_note(self, note_id):
-        """Get specific note by ID"""
-        for note in self.notes:
-            if note['id'] == note_id:
-                return note
-        return None
-    
+        """Get specific note by ID, loading its content on first access"""
+        note = self._by_id.get(note_id)
+        if note is not None and 'content' not in note:
+            try:
+                note['content'] = _read_json(self._note_file(note_id)).get('content', '')
+            except:
+                note['content'] = ''
+        return note
+
     def update_note(self, note_id, title, content):
         """Update existing note"""
-        for note in self.notes:
-            if note['id'] == note_id:
-                note['title'] = title
-                note['content'] = content
-                self._save_notes()
-                return True
-        return False
-    
+        note = self._by_id.get(note_id)
+        if note is None:
+            return False
+        note['title'] = title
+        note['content'] = content
+        self._refresh_caches()
+        self._enqueue_write(self._note_file(note_id), dict(note))
+        self._save_index()
+        return True
+
     def delete_note(self, note_id):
         """Delete a note"""
-        self.notes = [n for n in self.notes if n['id'] != note_id]
-        self._save_notes()
+        note = self._by_id.get(note_id)
+        if note is not None:
+            self.notes.remove(note)
+            self._refresh_caches()
+            self._enqueue_write(self._note_file(note_id), None)
+            self._save_index()
+
+    def delete_all(self):
+        """Delete every note (used by factory reset)"""
+        for note in self.notes:
+            self._enqueue_write(self._note_file(note['id']), None)
+        self.notes = []
+        self._refresh_caches()
+        self._save_index()
 
 
 class App:
@@ -265,107 +616,354 @@ class App:
         self.notes_manager = notes_manager
         self.settings_manager = settings_manager
         self.running = True
-    
+        # Reusable drawing surface - allocating a fresh Image per repaint
+        # is needless churn on the Pi
+        self._canvas = Image.new('1', (display.width, display.height), 255)
+        self._draw = ImageDraw.Draw(self._canvas)
+
     def create_image(self):
-        """Create image with correct colors based on dark mode"""
+        """Clear the reusable canvas to the background color and return it"""
         fg, bg = self.display.get_colors()
-        return Image.new('1', (self.display.width, self.display.height), bg), fg
+        # paste with a solid color is a single C-level fill, cheaper than
+        # an ImageDraw rectangle
+        self._canvas.paste(bg, (0, 0, self.display.width, self.display.height))
+        return self._canvas, fg
     
     def draw_text_centered(self, draw, text, y, font, size=20, fill=None):
         """Draw centered text"""
         if fill is None:
             fill, _ = self.display.get_colors()
-        
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
-        except:
-            fnt = ImageFont.load_default()
-        
+
+        fnt = _font(_BOLD_FONT, size)
+
         bbox = draw.textbbox((0, 0), text, font=fnt)
         text_width = bbox[2] - bbox[0]
         x = (self.display.width - text_width) // 2
         draw.text((x, y), text, font=fnt, fill=fill)
-    
+
+    def blit_lines(self, image, lines, fill, bg):
+        """Blit a batch of (x, y, text, font_path, size) text lines
+
+        Each line comes from the tile cache, so a frame's worth of text
+        costs a handful of C-level pastes instead of per-call FreeType
+        layout.
+        """
+        for x, y, text, path, size in lines:
+            image.paste(_text_tile(text, path, size, fill, bg), (x, y))
+
+    def reset(self):
+        """Clear per-session state before the app is re-entered"""
+        pass
+
+    def _nav_loop(self, count, redraw, on_enter, back):
+        """Shared list-navigation loop (w/s, digit jump, ENTER, ESC)
+
+        count() returns the current number of items - a callable because
+        on_enter may shrink the underlying list (e.g. deleting a note).
+        redraw() repaints the screen for the current selection; on_enter
+        handles ENTER and may return a route name to leave the app.
+        ESC returns the `back` route.
+        """
+        redraw()
+
+        while self.running:
+            key = self.keyboard.wait_key()
+
+            if not key:
+                continue
+
+            if key == 'w' and self.selected > 0:
+                self.selected -= 1
+                redraw()
+            elif key == 's' and self.selected < count() - 1:
+                self.selected += 1
+                redraw()
+            elif key.isdigit():
+                num = int(key)
+                if 1 <= num <= count():
+                    self.selected = num - 1
+                    redraw()
+            elif key == 'ENTER':
+                result = on_enter()
+                if result is not None:
+                    return result
+                # on_enter may have removed items - leave if none are
+                # left and keep the cursor in range otherwise
+                n = count()
+                if n == 0:
+                    return back
+                if self.selected >= n:
+                    self.selected = n - 1
+                redraw()
+            elif key == 'ESC':
+                return back
+
     def run(self):
         """Override this method in subclasses"""
         pass
 
 
+# Name tables so the per-second loop can format dates without strftime
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Unit vectors for the 6 cog teeth of the settings icon
+_COG_ANGLES = tuple((math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60)))
+                    for i in range(6))
+
+
+# 7-segment layout:
+#  aaa
+# f   b
+#  ggg
+# e   c
+#  ddd
+
+_SEGMENTS = {
+    '0': [1,1,1,1,1,1,0],
+    '1': [0,1,1,0,0,0,0],
+    '2': [1,1,0,1,1,0,1],
+    '3': [1,1,1,1,0,0,1],
+    '4': [0,1,1,0,0,1,1],
+    '5': [1,0,1,1,0,1,1],
+    '6': [1,0,1,1,1,1,1],
+    '7': [1,1,1,0,0,0,0],
+    '8': [1,1,1,1,1,1,1],
+    '9': [1,1,1,1,0,1,1],
+    ' ': [0,0,0,0,0,0,0],
+}
+
+# Pre-rendered glyph tiles keyed by (char, fill) - pasting a cached tile
+# replaces seven rectangle() calls per digit with one C-level blit
+_SEG_CACHE = {}
+
+
+def _build_glyph(char, fill, seg_width=4, seg_length=20):
+    """Render a single 7-segment glyph into a small tile image"""
+    w = seg_width
+    l = seg_length
+    bg = 255 if fill == 0 else 0
+    tile = Image.new('1', (2 * w + l, 3 * w + 2 * l), bg)
+    draw = ImageDraw.Draw(tile)
+
+    seg = _SEGMENTS.get(char, _SEGMENTS[' '])
+
+    # a (top)
+    if seg[0]:
+        draw.rectangle([w, 0, w+l, w], fill=fill)
+    # b (top right)
+    if seg[1]:
+        draw.rectangle([w+l, w, w+l+w, w+l], fill=fill)
+    # c (bottom right)
+    if seg[2]:
+        draw.rectangle([w+l, w+l+w, w+l+w, w+l+w+l], fill=fill)
+    # d (bottom)
+    if seg[3]:
+        draw.rectangle([w, w+l+w+l, w+l, w+l+w+l+w], fill=fill)
+    # e (bottom left)
+    if seg[4]:
+        draw.rectangle([0, w+l+w, w, w+l+w+l], fill=fill)
+    # f (top left)
+    if seg[5]:
+        draw.rectangle([0, w, w, w+l], fill=fill)
+    # g (middle)
+    if seg[6]:
+        draw.rectangle([w, w+l, w+l, w+l+w], fill=fill)
+
+    return tile
+
+
+def _build_colon(fill, seg_width=4, seg_length=20):
+    """Render the clock colon into a small tile image"""
+    bg = 255 if fill == 0 else 0
+    tile = Image.new('1', (10, 3 * seg_width + 2 * seg_length), bg)
+    draw = ImageDraw.Draw(tile)
+    draw.rectangle([3, 15, 7, 19], fill=fill)
+    draw.rectangle([3, 35, 7, 39], fill=fill)
+    return tile
+
+
+def _glyph(char, fill):
+    """Get the cached tile for a 7-segment character"""
+    key = (char, fill)
+    if key not in _SEG_CACHE:
+        if char == ':':
+            _SEG_CACHE[key] = _build_colon(fill)
+        else:
+            _SEG_CACHE[key] = _build_glyph(char, fill)
+    return _SEG_CACHE[key]
+
+
 class ClockApp(App):
     """Digital clock display with 7-segment style font"""
     def __init__(self, display, keyboard, notes_manager, settings_manager):
         super().__init__(display, keyboard, notes_manager, settings_manager)
         self.last_update = None
+        # Diff-refresh state: keep the previous frame and digit layout so a
+        # tick only has to redraw the digits that actually changed
+        self.prev_image = None
+        self.prev_digits = None
+        self.prev_style = None
+        # Time layout depends only on digit count and clock format
+        self._layout_cache = {}
+        # (date key, formatted string) for the current day
+        self._date_cache = (None, None)
+        # Tick updates always refresh partially (a full refresh takes
+        # ~2s and flashes); after this many partials do a full one to
+        # clear accumulated ghosting. Starting at the limit makes the
+        # first paint after entering the clock a full refresh.
+        self._full_every = 600
+        self._partial_count = self._full_every
+
+    def reset(self):
+        """Drop diff state so re-entering repaints fully"""
+        self.last_update = None
+        self.prev_image = None
+        self.prev_digits = None
+        self.prev_style = None
+        self._partial_count = self._full_every
+
+    def _show_tick(self, image):
+        """Push a tick update, honoring the refresh_mode setting"""
+        # 'full' forces the flashing refresh on every tick (no ghosting
+        # at all); 'partial' is fast with a periodic full to clean up
+        if self.settings_manager.get_setting('refresh_mode', 'partial') == 'full':
+            self._partial_count = 0
+            self.display.show(image)
+        elif self._partial_count >= self._full_every:
+            self._partial_count = 0
+            self.display.show(image)
+        else:
+            self._partial_count += 1
+            self.display.show(image, partial=True)
     
-    def draw_7segment_digit(self, draw, digit, x, y, seg_width=4, seg_length=20, fill=0):
-        """Draw a single 7-segment digit"""
-        # 7-segment layout:
-        #  aaa
-        # f   b
-        #  ggg
-        # e   c
-        #  ddd
-        
-        segments = {
-            '0': [1,1,1,1,1,1,0],
-            '1': [0,1,1,0,0,0,0],
-            '2': [1,1,0,1,1,0,1],
-            '3': [1,1,1,1,0,0,1],
-            '4': [0,1,1,0,0,1,1],
-            '5': [1,0,1,1,0,1,1],
-            '6': [1,0,1,1,1,1,1],
-            '7': [1,1,1,0,0,0,0],
-            '8': [1,1,1,1,1,1,1],
-            '9': [1,1,1,1,0,1,1],
-            ' ': [0,0,0,0,0,0,0],
-        }
-        
-        if digit not in segments:
+    def draw_7segment_digit(self, image, digit, x, y, fill=0):
+        """Draw a single 7-segment digit by pasting its cached tile"""
+        if digit not in _SEGMENTS:
             return
-        
-        seg = segments[digit]
-        w = seg_width
-        l = seg_length
-        
-        # Segment positions
-        # a (top)
-        if seg[0]:
-            draw.rectangle([x+w, y, x+w+l, y+w], fill=fill)
-        # b (top right)
-        if seg[1]:
-            draw.rectangle([x+w+l, y+w, x+w+l+w, y+w+l], fill=fill)
-        # c (bottom right)
-        if seg[2]:
-            draw.rectangle([x+w+l, y+w+l+w, x+w+l+w, y+w+l+w+l], fill=fill)
-        # d (bottom)
-        if seg[3]:
-            draw.rectangle([x+w, y+w+l+w+l, x+w+l, y+w+l+w+l+w], fill=fill)
-        # e (bottom left)
-        if seg[4]:
-            draw.rectangle([x, y+w+l+w, x+w, y+w+l+w+l], fill=fill)
-        # f (top left)
-        if seg[5]:
-            draw.rectangle([x, y+w, x+w, y+w+l], fill=fill)
-        # g (middle)
-        if seg[6]:
-            draw.rectangle([x+w, y+w+l, x+w+l, y+w+l+w], fill=fill)
-    
-    def draw_7segment_time(self, draw, time_str, x, y, fill=0):
+        image.paste(_glyph(digit, fill), (x, y))
+
+    def draw_7segment_time(self, image, time_str, x, y, fill=0):
         """Draw time string with 7-segment digits"""
         digit_width = 30
         colon_width = 10
-        
+
         current_x = x
         for char in time_str:
             if char == ':':
-                # Draw colon
-                draw.rectangle([current_x+3, y+15, current_x+7, y+19], fill=fill)
-                draw.rectangle([current_x+3, y+35, current_x+7, y+39], fill=fill)
+                image.paste(_glyph(':', fill), (current_x, y))
                 current_x += colon_width
             else:
-                self.draw_7segment_digit(draw, char, current_x, y, fill=fill)
+                self.draw_7segment_digit(image, char, current_x, y, fill=fill)
                 current_x += digit_width
-    
+
+    def digit_positions(self, time_str, start_x):
+        """Compute (char, x) layout for the digits in a time string"""
+        digit_width = 30
+        colon_width = 10
+
+        positions = []
+        current_x = start_x
+        for char in time_str:
+            if char == ':':
+                current_x += colon_width
+            else:
+                positions.append((char, current_x))
+                current_x += digit_width
+        return positions
+
+    def draw_clock(self, now, show_seconds):
+        """Redraw the clock, touching only the digits that changed"""
+        fg, bg = self.display.get_colors()
+
+        # Get date format; the string only changes once a day, so it is
+        # cached instead of formatted every tick
+        date_format = self.settings_manager.get_setting('date_format', 'long')
+        date_key = (now.year, now.month, now.day, date_format)
+        if self._date_cache[0] == date_key:
+            date_str = self._date_cache[1]
+        else:
+            if date_format == 'long':
+                date_str = (f"{_WEEKDAYS[now.weekday()]}, "
+                            f"{_MONTHS[now.month - 1]} {now.day:02d}, {now.year}")
+            elif date_format == 'short':
+                date_str = f"{now.month:02d}/{now.day:02d}/{now.year}"
+            else:  # iso
+                date_str = f"{now.year}-{now.month:02d}-{now.day:02d}"
+            self._date_cache = (date_key, date_str)
+
+        clock_format = self.settings_manager.get_setting('clock_format', 12)
+        if clock_format == 12:
+            hour = now.hour % 12 or 12
+            # Space-pad single-digit hours (no leading zero)
+            if show_seconds:
+                time_str = f"{hour:2d}:{now.minute:02d}:{now.second:02d}"
+            else:
+                time_str = f"{hour:2d}:{now.minute:02d}"
+            ampm = 'AM' if now.hour < 12 else 'PM'
+        else:
+            if show_seconds:
+                time_str = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+            else:
+                time_str = f"{now.hour:02d}:{now.minute:02d}"
+            ampm = ''
+
+        # Starting x position to center the time - cached since it only
+        # depends on the digit count and clock format
+        char_count = len(time_str)
+        layout = self._layout_cache.get((char_count, clock_format))
+        if layout is None:
+            time_width = char_count * 30 - 20
+            if clock_format == 12:
+                start_x = (self.display.width - time_width) // 2 - 20
+            else:
+                start_x = (self.display.width - time_width) // 2
+            layout = (start_x, time_width)
+            self._layout_cache[(char_count, clock_format)] = layout
+        start_x, time_width = layout
+
+        digits = self.digit_positions(time_str, start_x)
+
+        # Everything except the digits themselves - if any of this changed
+        # (date rolled over, AM/PM flipped, settings edited) fall back to a
+        # full repaint
+        style = (fg, clock_format, show_seconds, date_str, ampm, start_x)
+
+        if self.prev_image is None or style != self.prev_style:
+            image, fg = self.create_image()
+            draw = self._draw
+
+            # Draw date at top (bigger)
+            self.draw_text_centered(draw, date_str, 5, None, 18, fg)
+
+            self.draw_7segment_time(image, time_str, start_x, 35, fg)
+
+            # Draw AM/PM to the right of the time (only for 12-hour format)
+            if clock_format == 12:
+                draw.text((start_x + time_width + 10, 50), ampm, font=_font(_BOLD_FONT, 20), fill=fg)
+
+            self._show_tick(image)
+
+            self.prev_image = image
+            self.prev_digits = digits
+            self.prev_style = style
+            return
+
+        # Partial path: repaint only the digit cells that changed (the
+        # glyph tiles carry their own background, so a paste replaces the
+        # whole cell)
+        changed = False
+
+        for (old_char, x), (new_char, _) in zip(self.prev_digits, digits):
+            if old_char != new_char:
+                self.draw_7segment_digit(self.prev_image, new_char, x, 35, fill=fg)
+                changed = True
+
+        if changed:
+            self._show_tick(self.prev_image)
+            self.prev_digits = digits
+
     def run(self):
         """Main clock loop"""
         while self.running:
@@ -374,77 +972,26 @@ class ClockApp(App):
             # Check update interval based on show_seconds setting
             show_seconds = self.settings_manager.get_setting('show_seconds', False)
             if show_seconds:
-                current_time = now.strftime('%H:%M:%S')
+                current_time = (now.hour, now.minute, now.second)
             else:
-                current_time = now.strftime('%H:%M')
+                current_time = (now.hour, now.minute)
             
             # Only update display when time changes
             if current_time != self.last_update:
-                image, fg = self.create_image()
-                draw = ImageDraw.Draw(image)
-                
-                # Get date format
-                date_format = self.settings_manager.get_setting('date_format', 'long')
-                if date_format == 'long':
-                    date_str = now.strftime('%a, %b %d, %Y')
-                elif date_format == 'short':
-                    date_str = now.strftime('%m/%d/%Y')
-                else:  # iso
-                    date_str = now.strftime('%Y-%m-%d')
-                
-                # Draw date at top (bigger)
-                self.draw_text_centered(draw, date_str, 5, None, 18, fg)
-                
-                # Draw time with 7-segment display
-                clock_format = self.settings_manager.get_setting('clock_format', 12)
-                if clock_format == 12:
-                    if show_seconds:
-                        time_str = now.strftime('%I:%M:%S')
-                    else:
-                        time_str = now.strftime('%I:%M')
-                    # Remove leading zero from hour
-                    if time_str[0] == '0':
-                        time_str = ' ' + time_str[1:]
-                else:
-                    if show_seconds:
-                        time_str = now.strftime('%H:%M:%S')
-                    else:
-                        time_str = now.strftime('%H:%M')
-                
-                # Calculate starting x position to center the time
-                char_count = len(time_str)
-                time_width = char_count * 30 - 20
-                if clock_format == 12:
-                    start_x = (self.display.width - time_width) // 2 - 20
-                else:
-                    start_x = (self.display.width - time_width) // 2
-                
-                self.draw_7segment_time(draw, time_str, start_x, 35, fg)
-                
-                # Draw AM/PM to the right of the time (only for 12-hour format)
-                if clock_format == 12:
-                    ampm = now.strftime('%p')
-                    try:
-                        ampm_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-                    except:
-                        ampm_font = ImageFont.load_default()
-                    draw.text((start_x + time_width + 10, 50), ampm, font=ampm_font, fill=fg)
-                
-                # Display on screen
-                refresh_mode = self.settings_manager.get_setting('refresh_mode', 'partial')
-                self.display.show(image, partial=(refresh_mode == 'partial'))
+                self.draw_clock(now, show_seconds)
                 self.last_update = current_time
             
-            # Check for any keypress to go to main menu
-            key = self.keyboard.get_key()
-            if key:
-                return 'main_menu'
-            
-            # Sleep interval based on show_seconds
+            # Sleep until the next tick boundary, waking early on any
+            # keypress (which goes to the main menu)
+            now = datetime.now()
             if show_seconds:
-                time.sleep(0.5)
+                wait = 1.0 - now.microsecond / 1e6
             else:
-                time.sleep(1)
+                wait = 60 - now.second - now.microsecond / 1e6
+
+            key = self.keyboard.wait_key(timeout=max(wait, 0.05))
+            if key:
+                return 'main_menu'
 
 
 class MainMenuApp(App):
@@ -464,7 +1011,30 @@ class MainMenuApp(App):
             {'num': 7, 'name': 'System', 'icon_type': 'system'},
             {'num': 8, 'name': 'Settings', 'icon_type': 'settings'},
         ]
-    
+
+        # Grid geometry is fixed, so work out each cell's origin and icon
+        # position once instead of on every repaint
+        self.cell_width = display.width // 4
+        self.cell_height = (display.height - 20) // 2
+        icon_size = 20
+        for i, app in enumerate(self.apps):
+            row = i // 4
+            col = i % 4
+            app['x'] = col * self.cell_width
+            app['y'] = 20 + row * self.cell_height
+            app['icon_x'] = app['x'] + (self.cell_width - icon_size) // 2
+            app['icon_y'] = app['y'] + (self.cell_height - icon_size) // 2 - 5
+
+        # Static menu chrome rendered lazily per foreground color
+        self._menu_bg = None
+        self._menu_bg_fg = None
+        self._drawn = False
+
+    def reset(self):
+        """Start from the first slot with a full first paint"""
+        self.selected = 0
+        self._drawn = False
+
     def draw_clock_icon(self, draw, x, y, size=20, fill=0):
         """Draw a simple clock icon"""
         center_x = x + size // 2
@@ -511,15 +1081,13 @@ class MainMenuApp(App):
         inner_radius = size // 4
         outer_radius = size // 2
         
-        # Draw simplified cog with 6 teeth
-        import math
-        for i in range(6):
-            angle = i * 60 * math.pi / 180
+        # Draw simplified cog with 6 teeth (unit vectors precomputed)
+        for cos_a, sin_a in _COG_ANGLES:
             # Outer tooth
-            x1 = center_x + int(outer_radius * math.cos(angle))
-            y1 = center_y + int(outer_radius * math.sin(angle))
-            x2 = center_x + int(inner_radius * math.cos(angle))
-            y2 = center_y + int(inner_radius * math.sin(angle))
+            x1 = center_x + int(outer_radius * cos_a)
+            y1 = center_y + int(outer_radius * sin_a)
+            x2 = center_x + int(inner_radius * cos_a)
+            y2 = center_y + int(inner_radius * sin_a)
             draw.line([x2, y2, x1, y1], fill=fill, width=2)
         
         # Center circle
@@ -547,49 +1115,28 @@ class MainMenuApp(App):
     
     def draw_placeholder_icon(self, draw, x, y, size=20, fill=0):
         """Draw a question mark icon"""
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
-        except:
-            fnt = ImageFont.load_default()
-        
-        draw.text((x, y), "?", font=fnt, fill=fill)
+        draw.text((x, y), "?", font=_font(_BOLD_FONT, size), fill=fill)
     
-    def draw_menu(self):
-        """Draw the main menu"""
-        image, fg = self.create_image()
+    def _build_menu_bg(self, fg, bg):
+        """Render the static menu chrome (title, numbers, icons) once"""
+        image = Image.new('1', (self.display.width, self.display.height), bg)
         draw = ImageDraw.Draw(image)
-        
+
         # Title
         self.draw_text_centered(draw, "MAIN MENU", 2, None, 14, fg)
-        
+
         # Draw grid (2 rows x 4 cols)
-        cell_width = self.display.width // 4
-        cell_height = (self.display.height - 20) // 2
-        
-        for i, app in enumerate(self.apps):
-            row = i // 4
-            col = i % 4
-            
-            x = col * cell_width
-            y = 20 + row * cell_height
-            
-            # Highlight selected app
-            if i == self.selected:
-                draw.rectangle([x+2, y+2, x+cell_width-2, y+cell_height-2], outline=fg, width=2)
-            
+        fnt = _font(_BOLD_FONT, 12)
+        icon_size = 20
+
+        for app in self.apps:
             # Draw app number
-            try:
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
-            except:
-                fnt = ImageFont.load_default()
-            
-            draw.text((x+5, y+5), str(app['num']), font=fnt, fill=fg)
-            
+            draw.text((app['x']+5, app['y']+5), str(app['num']), font=fnt, fill=fg)
+
             # Draw app icon in center
-            icon_size = 20
-            icon_x = x + (cell_width - icon_size) // 2
-            icon_y = y + (cell_height - icon_size) // 2 - 5
-            
+            icon_x = app['icon_x']
+            icon_y = app['icon_y']
+
             if app['icon_type'] == 'clock':
                 self.draw_clock_icon(draw, icon_x, icon_y, icon_size, fg)
             elif app['icon_type'] == 'notes':
@@ -602,45 +1149,81 @@ class MainMenuApp(App):
                 self.draw_settings_icon(draw, icon_x, icon_y, icon_size, fg)
             else:
                 self.draw_placeholder_icon(draw, icon_x, icon_y, icon_size, fg)
-        
-        self.display.show(image)
+
+        return image
+
+    def draw_menu(self):
+        """Draw the main menu: paste the static chrome, add the highlight"""
+        fg, bg = self.display.get_colors()
+
+        if self._menu_bg is None or self._menu_bg_fg != fg:
+            self._menu_bg = self._build_menu_bg(fg, bg)
+            self._menu_bg_fg = fg
+
+        self._canvas.paste(self._menu_bg, (0, 0))
+
+        # Highlight selected app
+        app = self.apps[self.selected]
+        self._draw.rectangle([app['x']+2, app['y']+2,
+                              app['x']+self.cell_width-2, app['y']+self.cell_height-2],
+                             outline=fg, width=2)
+
+        # First paint after entering gets a full refresh; cursor moves
+        # only need a partial one
+        self.display.show(self._canvas, partial=self._drawn)
+        self._drawn = True
     
     def run(self):
         """Main menu loop"""
         self.draw_menu()
-        
+
         while self.running:
-            key = self.keyboard.get_key()
-            
+            key = self.keyboard.wait_key()
+
             if not key:
-                time.sleep(0.1)
                 continue
-            
-            # Handle WASD navigation
-            if key == 'w':
-                if self.selected >= 4:
-                    self.selected -= 4
-                    self.draw_menu()
-            elif key == 's':
-                if self.selected < 4:
-                    self.selected += 4
-                    self.draw_menu()
-            elif key == 'a':
-                if self.selected % 4 != 0:
-                    self.selected -= 1
-                    self.draw_menu()
-            elif key == 'd':
-                if self.selected % 4 != 3:
-                    self.selected += 1
-                    self.draw_menu()
-            
-            # Handle number key direct selection
-            elif key in '12345678':
-                self.selected = int(key) - 1
-                self.draw_menu()
-            
+
+            # Coalesce a burst of queued keys (e.g. a held WASD key)
+            # into one net movement and a single redraw
+            keys = [key] + self.keyboard.drain_keys()
+
+            action = None
+            moved = False
+            for key in keys:
+                # Handle WASD navigation
+                if key == 'w':
+                    if self.selected >= 4:
+                        self.selected -= 4
+                        moved = True
+                elif key == 's':
+                    if self.selected < 4:
+                        self.selected += 4
+                        moved = True
+                elif key == 'a':
+                    if self.selected % 4 != 0:
+                        self.selected -= 1
+                        moved = True
+                elif key == 'd':
+                    if self.selected % 4 != 3:
+                        self.selected += 1
+                        moved = True
+
+                # Handle number key direct selection
+                elif key in '12345678':
+                    self.selected = int(key) - 1
+                    moved = True
+
+                # ENTER/ESC act after any movement in the batch
+                elif key == 'ENTER' or key == 'ESC':
+                    action = key
+                    break
+
+            # ESC to go back to clock
+            if action == 'ESC':
+                return 'clock'
+
             # Handle Enter key to launch app
-            elif key == 'ENTER':
+            if action == 'ENTER':
                 app_num = self.selected + 1
                 if app_num == 1:
                     return 'clock'
@@ -655,16 +1238,14 @@ class MainMenuApp(App):
                 else:
                     # Placeholder apps - show message
                     image, fg = self.create_image()
-                    draw = ImageDraw.Draw(image)
+                    draw = self._draw
                     self.draw_text_centered(draw, f"App {app_num}", 40, None, 16, fg)
                     self.draw_text_centered(draw, "Coming Soon!", 65, None, 14, fg)
                     self.display.show(image)
                     time.sleep(2)
                     self.draw_menu()
-            
-            # ESC to go back to clock
-            elif key == 'ESC':
-                return 'clock'
+            elif moved:
+                self.draw_menu()
 
 
 class NotesMenuApp(App):
@@ -676,41 +1257,49 @@ class NotesMenuApp(App):
             '1. Create New Note',
             '2. View/Edit Notes'
         ]
-    
+        self._menu_bg = None
+        self._menu_bg_fg = None
+        self._drawn = False
+
+    def reset(self):
+        """Start from the first option with a full first paint"""
+        self.selected = 0
+        self._drawn = False
+
     def draw_menu(self):
-        """Draw notes menu"""
-        image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
-        
-        self.draw_text_centered(draw, "NOTES", 5, None, 16, fg)
-        
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        except:
-            fnt = ImageFont.load_default()
-        
-        for i, option in enumerate(self.options):
-            y = 35 + i * 30
-            
-            # Highlight selected
-            if i == self.selected:
-                draw.text((10, y), '>', font=fnt, fill=fg)
-            
-            draw.text((25, y), option, font=fnt, fill=fg)
-        
-        self.display.show(image)
+        """Draw notes menu: static chrome plus the moving cursor"""
+        fg, bg = self.display.get_colors()
+        fnt = _font(_REGULAR_FONT, 14)
+
+        if self._menu_bg is None or self._menu_bg_fg != fg:
+            image = Image.new('1', (self.display.width, self.display.height), bg)
+            draw = ImageDraw.Draw(image)
+
+            self.draw_text_centered(draw, "NOTES", 5, None, 16, fg)
+            for i, option in enumerate(self.options):
+                draw.text((25, 35 + i * 30), option, font=fnt, fill=fg)
+
+            self._menu_bg = image
+            self._menu_bg_fg = fg
+
+        self._canvas.paste(self._menu_bg, (0, 0))
+
+        # Highlight selected
+        self._draw.text((10, 35 + self.selected * 30), '>', font=fnt, fill=fg)
+
+        self.display.show(self._canvas, partial=self._drawn)
+        self._drawn = True
     
     def run(self):
         """Notes menu loop"""
         self.draw_menu()
-        
+
         while self.running:
-            key = self.keyboard.get_key()
-            
+            key = self.keyboard.wait_key()
+
             if not key:
-                time.sleep(0.1)
                 continue
-            
+
             if key == 'w' and self.selected > 0:
                 self.selected -= 1
                 self.draw_menu()
@@ -736,53 +1325,44 @@ class CreateNoteApp(App):
     
     def get_text_input(self, prompt, max_length=50):
         """Get text input from keyboard"""
-        text = ""
-        
+        chars = []
+        fnt = _font(_REGULAR_FONT, 12)
+
+        # Prompt and bottom instructions never change while typing -
+        # render them once into a static base frame
+        image, fg = self.create_image()
+        self._draw.text((5, 5), prompt, font=fnt, fill=fg)
+        self._draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
+        self._draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
+        base = image.copy()
+
         while True:
-            # Draw input screen
-            image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except:
-                fnt = ImageFont.load_default()
-            
-            draw.text((5, 5), prompt, font=fnt, fill=fg)
-            
+            # Only the text lines change per keystroke
+            self._canvas.paste(base, (0, 0))
+
             # Show current text with cursor
-            display_text = text + "_"
+            display_text = ''.join(chars) + "_"
             # Wrap text if too long
             if len(display_text) > 30:
-                line1 = display_text[:30]
-                line2 = display_text[30:60]
-                draw.text((5, 30), line1, font=fnt, fill=fg)
-                draw.text((5, 45), line2, font=fnt, fill=fg)
+                self._draw.text((5, 30), display_text[:30], font=fnt, fill=fg)
+                self._draw.text((5, 45), display_text[30:60], font=fnt, fill=fg)
             else:
-                draw.text((5, 30), display_text, font=fnt, fill=fg)
-            
-            # Bottom instructions - split left and right
-            draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
-            draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
-            
+                self._draw.text((5, 30), display_text, font=fnt, fill=fg)
+
             # Use partial refresh for faster typing
-            self.display.show(image, partial=True)
-            
+            self.display.show(self._canvas, partial=True)
+
             # Wait for key
-            while True:
-                key = self.keyboard.get_key()
-                if key:
-                    break
-                time.sleep(0.05)
-            
+            key = self.keyboard.wait_key()
+
             if key == 'ENTER':
-                return text
+                return ''.join(chars)
             elif key == 'ESC':
                 return None
-            elif key == 'BACKSPACE' and len(text) > 0:
-                text = text[:-1]
-            elif key and len(key) == 1 and len(text) < max_length:
-                text += key
+            elif key == 'BACKSPACE' and chars:
+                chars.pop()
+            elif key and len(key) == 1 and len(chars) < max_length:
+                chars.append(key)
     
     def run(self):
         """Create note flow"""
@@ -801,7 +1381,7 @@ class CreateNoteApp(App):
         
         # Show success message
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
+        draw = self._draw
         self.draw_text_centered(draw, "Note Saved!", 50, None, 16, fg)
         self.display.show(image)
         time.sleep(1.5)
@@ -809,103 +1389,106 @@ class CreateNoteApp(App):
         return 'notes_menu'
 
 
+@functools.lru_cache(maxsize=64)
+def _wrap_lines(content, chars_per_line=35):
+    """Word-wrap note content into display lines (cached per content string)"""
+    return textwrap.wrap(content, width=chars_per_line)
+
+
 class ViewNotesApp(App):
     """View and edit notes list"""
     def __init__(self, display, keyboard, notes_manager, settings_manager):
         super().__init__(display, keyboard, notes_manager, settings_manager)
         self.selected = 0
         self.scroll_offset = 0
-    
+        self._list_bg = None
+        self._list_bg_fg = None
+
+    def reset(self):
+        """Start at the top of the list"""
+        self.selected = 0
+        self.scroll_offset = 0
+
     def draw_notes_list(self):
         """Draw list of notes"""
         notes = self.notes_manager.get_notes()
-        
-        image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
-        
+        fnt = _font(_REGULAR_FONT, 11)
+
         if not notes:
-            self.draw_text_centered(draw, "No notes yet", 50, None, 14, fg)
+            image, fg = self.create_image()
+            self.draw_text_centered(self._draw, "No notes yet", 50, None, 14, fg)
             self.display.show(image)
             return
-        
-        self.draw_text_centered(draw, "YOUR NOTES", 2, None, 12, fg)
-        
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-        except:
-            fnt = ImageFont.load_default()
-        
+
+        fg, bg = self.display.get_colors()
+
+        # Title and footer are static - render them once per color scheme
+        if self._list_bg is None or self._list_bg_fg != fg:
+            image = Image.new('1', (self.display.width, self.display.height), bg)
+            draw = ImageDraw.Draw(image)
+            self.draw_text_centered(draw, "YOUR NOTES", 2, None, 12, fg)
+            draw.text((5, 105), "ENTER=View ESC=Back", font=fnt, fill=fg)
+            self._list_bg = image
+            self._list_bg_fg = fg
+
+        self._canvas.paste(self._list_bg, (0, 0))
+        draw = self._draw
+
         # Show up to 5 notes at a time
         visible_notes = 5
         start_idx = self.scroll_offset
         end_idx = min(start_idx + visible_notes, len(notes))
-        
+
         for i in range(start_idx, end_idx):
-            note = notes[i]
             y = 20 + (i - start_idx) * 18
-            
+
             # Highlight selected
             if i == self.selected:
                 draw.text((5, y), '>', font=fnt, fill=fg)
-            
-            # Truncate title if too long
-            title = note['title']
-            if len(title) > 25:
-                title = title[:22] + "..."
-            
-            draw.text((15, y), f"{i+1}. {title}", font=fnt, fill=fg)
-        
+
+            # Titles are pre-truncated by the notes manager
+            draw.text((15, y), self.notes_manager.display_titles[i], font=fnt, fill=fg)
+
         # Show scroll indicators
         if start_idx > 0:
             draw.text((230, 20), "^", font=fnt, fill=fg)
         if end_idx < len(notes):
             draw.text((230, 95), "v", font=fnt, fill=fg)
-        
-        draw.text((5, 105), "ENTER=View ESC=Back", font=fnt, fill=fg)
-        
+
         # Use partial refresh for faster navigation
-        self.display.show(image, partial=True)
+        self.display.show(self._canvas, partial=True)
     
     def view_note(self, note):
         """Display a single note with edit/delete options"""
+        image, fg = self.create_image()
+        draw = self._draw
+
+        fnt_title = _font(_BOLD_FONT, 12)
+        fnt = _font(_REGULAR_FONT, 10)
+
+        # Title
+        title = note['title']
+        if len(title) > 30:
+            title = title[:27] + "..."
+        draw.text((5, 2), title, font=fnt_title, fill=fg)
+
+        # Content: wrapped lines are cached per content string and the
+        # whole block renders in one multiline_text call
+        lines = _wrap_lines(note['content'])
+        if len(lines) > 5:
+            lines = lines[:5] + ["..."]
+        draw.multiline_text((5, 18), "\n".join(lines), font=fnt, fill=fg, spacing=2)
+
+        # Options at bottom
+        draw.text((5, 95), "E=Edit D=Delete", font=fnt, fill=fg)
+        draw.text((5, 108), "ESC=Back", font=fnt, fill=fg)
+
+        self.display.show(image, partial=True)
+
+        # Nothing changes until a key arrives - block instead of
+        # redrawing the same note at 10Hz
         while True:
-            image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                fnt_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-            except:
-                fnt_title = fnt = ImageFont.load_default()
-            
-            # Title
-            title = note['title']
-            if len(title) > 30:
-                title = title[:27] + "..."
-            draw.text((5, 2), title, font=fnt_title, fill=fg)
-            
-            # Content (wrap text)
-            content = note['content']
-            y = 18
-            line_height = 12
-            chars_per_line = 35
-            
-            for i in range(0, len(content), chars_per_line):
-                if y > 75:
-                    draw.text((5, y), "...", font=fnt, fill=fg)
-                    break
-                line = content[i:i+chars_per_line]
-                draw.text((5, y), line, font=fnt, fill=fg)
-                y += line_height
-            
-            # Options at bottom
-            draw.text((5, 95), "E=Edit D=Delete", font=fnt, fill=fg)
-            draw.text((5, 108), "ESC=Back", font=fnt, fill=fg)
-            
-            self.display.show(image, partial=True)
-            
-            # Wait for key
-            key = self.keyboard.get_key()
+            key = self.keyboard.wait_key()
             if key == 'ESC':
                 return
             elif key == 'e' or key == 'E':
@@ -917,7 +1500,6 @@ class ViewNotesApp(App):
                 if self.confirm_delete():
                     self.notes_manager.delete_note(note['id'])
                 return
-            time.sleep(0.1)
     
     def edit_note(self, note):
         """Edit an existing note"""
@@ -936,68 +1518,59 @@ class ViewNotesApp(App):
         
         # Show success
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
+        draw = self._draw
         self.draw_text_centered(draw, "Note Updated!", 50, None, 16, fg)
         self.display.show(image)
         time.sleep(1.5)
     
     def get_text_input_with_default(self, prompt, default_text, max_length=50):
         """Get text input with pre-filled default text"""
-        text = default_text
-        
+        chars = list(default_text)
+        fnt = _font(_REGULAR_FONT, 12)
+
+        # Prompt and bottom instructions never change while typing -
+        # render them once into a static base frame
+        image, fg = self.create_image()
+        self._draw.text((5, 5), prompt, font=fnt, fill=fg)
+        self._draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
+        self._draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
+        base = image.copy()
+
         while True:
-            image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except:
-                fnt = ImageFont.load_default()
-            
-            draw.text((5, 5), prompt, font=fnt, fill=fg)
-            
+            # Only the text lines change per keystroke
+            self._canvas.paste(base, (0, 0))
+
             # Show current text with cursor
-            display_text = text + "_"
+            display_text = ''.join(chars) + "_"
             # Wrap text if too long
             if len(display_text) > 30:
-                line1 = display_text[:30]
-                line2 = display_text[30:60]
-                draw.text((5, 30), line1, font=fnt, fill=fg)
-                draw.text((5, 45), line2, font=fnt, fill=fg)
+                self._draw.text((5, 30), display_text[:30], font=fnt, fill=fg)
+                self._draw.text((5, 45), display_text[30:60], font=fnt, fill=fg)
             else:
-                draw.text((5, 30), display_text, font=fnt, fill=fg)
-            
-            draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
-            draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
-            
-            self.display.show(image, partial=True)
-            
+                self._draw.text((5, 30), display_text, font=fnt, fill=fg)
+
+            # Use partial refresh for faster typing
+            self.display.show(self._canvas, partial=True)
+
             # Wait for key
-            while True:
-                key = self.keyboard.get_key()
-                if key:
-                    break
-                time.sleep(0.05)
-            
+            key = self.keyboard.wait_key()
+
             if key == 'ENTER':
-                return text
+                return ''.join(chars)
             elif key == 'ESC':
                 return None
-            elif key == 'BACKSPACE' and len(text) > 0:
-                text = text[:-1]
-            elif key and len(key) == 1 and len(text) < max_length:
-                text += key
+            elif key == 'BACKSPACE' and chars:
+                chars.pop()
+            elif key and len(key) == 1 and len(chars) < max_length:
+                chars.append(key)
     
     def confirm_delete(self):
         """Confirm deletion"""
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except:
-            fnt = ImageFont.load_default()
-        
+        draw = self._draw
+
+        fnt = _font(_REGULAR_FONT, 12)
+
         self.draw_text_centered(draw, "Delete Note?", 40, None, 14, fg)
         draw.text((5, 95), "ENTER=Confirm", font=fnt, fill=fg)
         draw.text((150, 95), "ESC=Cancel", font=fnt, fill=fg)
@@ -1005,13 +1578,12 @@ class ViewNotesApp(App):
         self.display.show(image)
         
         while True:
-            key = self.keyboard.get_key()
+            key = self.keyboard.wait_key()
             if key == 'ENTER':
                 return True
             elif key == 'ESC':
                 return False
-            time.sleep(0.1)
-    
+
     def run(self):
         """View notes loop"""
         notes = self.notes_manager.get_notes()
@@ -1019,62 +1591,65 @@ class ViewNotesApp(App):
         if not notes:
             # Show empty message
             image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
+            draw = self._draw
             self.draw_text_centered(draw, "No notes yet", 45, None, 14, fg)
             self.draw_text_centered(draw, "Press ESC to go back", 70, None, 12, fg)
             self.display.show(image)
             
             while True:
-                key = self.keyboard.get_key()
-                if key == 'ESC':
+                if self.keyboard.wait_key() == 'ESC':
                     return 'notes_menu'
-                time.sleep(0.1)
-        
-        self.draw_notes_list()
         
-        while self.running:
-            key = self.keyboard.get_key()
-            
-            if not key:
-                time.sleep(0.1)
-                continue
-            
-            if key == 'w' and self.selected > 0:
-                self.selected -= 1
-                if self.selected < self.scroll_offset:
-                    self.scroll_offset = self.selected
-                self.draw_notes_list()
-            elif key == 's' and self.selected < len(notes) - 1:
-                self.selected += 1
-                if self.selected >= self.scroll_offset + 5:
-                    self.scroll_offset = self.selected - 4
-                self.draw_notes_list()
-            elif key.isdigit():
-                num = int(key)
-                if 1 <= num <= len(notes):
-                    self.selected = num - 1
-                    self.draw_notes_list()
-            elif key == 'ENTER':
-                note = notes[self.selected]
-                self.view_note(note)
-                self.draw_notes_list()
-            elif key == 'ESC':
+        def redraw():
+            # Deleting can shrink the list in place - pull the cursor
+            # back inside the live bounds before drawing
+            if self.selected >= len(notes):
+                self.selected = max(len(notes) - 1, 0)
+            # Keep the 5-row window following the selection
+            if self.selected < self.scroll_offset:
+                self.scroll_offset = self.selected
+            elif self.selected >= self.scroll_offset + 5:
+                self.scroll_offset = self.selected - 4
+            self.draw_notes_list()
+
+        def open_selected():
+            if not notes:
                 return 'notes_menu'
+            if self.selected >= len(notes):
+                self.selected = len(notes) - 1
+            note = self.notes_manager.get_note(notes[self.selected]['id'])
+            self.view_note(note)
+
+        return self._nav_loop(lambda: len(notes), redraw, open_selected,
+                              'notes_menu')
 
 
 class WeatherApp(App):
     """Display weather information"""
+
+    # Shared across instances: keep-alive session plus a short-lived
+    # response cache so re-entering the app doesn't refetch
+    _session = requests.Session()
+    _cache = {}  # zip_code -> (data, expires_at)
+    _cache_ttl = 600  # seconds
+
     def __init__(self, display, keyboard, notes_manager, settings_manager):
         super().__init__(display, keyboard, notes_manager, settings_manager)
-    
+
     def get_weather(self, zip_code):
         """Fetch weather data from wttr.in using US ZIP code"""
+        cached = self._cache.get(zip_code)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+
         try:
             # For US ZIP codes, we need to add "USA" to help wttr.in locate it correctly
             url = f"http://wttr.in/{zip_code},USA?format=j1"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                self._cache[zip_code] = (data, time.time() + self._cache_ttl)
+                return data
         except Exception as e:
             print(f"Weather fetch error: {e}")
         return None
@@ -1086,21 +1661,19 @@ class WeatherApp(App):
         if not zip_code:
             # No zip code set
             image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
+            draw = self._draw
             self.draw_text_centered(draw, "No ZIP Code Set", 30, None, 14, fg)
             self.draw_text_centered(draw, "Configure in Settings", 55, None, 12, fg)
             self.draw_text_centered(draw, "Press ESC to go back", 80, None, 10, fg)
             self.display.show(image)
-            
+
             while True:
-                key = self.keyboard.get_key()
-                if key == 'ESC':
+                if self.keyboard.wait_key() == 'ESC':
                     return 'main_menu'
-                time.sleep(0.1)
         
         # Show loading message
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
+        draw = self._draw
         self.draw_text_centered(draw, "Loading Weather...", 50, None, 14, fg)
         self.display.show(image)
         
@@ -1110,103 +1683,104 @@ class WeatherApp(App):
         if not weather_data:
             # Error fetching weather
             image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
+            draw = self._draw
             self.draw_text_centered(draw, "Weather Error", 30, None, 14, fg)
             self.draw_text_centered(draw, "Check connection/ZIP", 55, None, 11, fg)
             self.draw_text_centered(draw, "Press ESC to go back", 80, None, 10, fg)
             self.display.show(image)
-            
+
             while True:
-                key = self.keyboard.get_key()
-                if key == 'ESC':
+                if self.keyboard.wait_key() == 'ESC':
                     return 'main_menu'
-                time.sleep(0.1)
         
-        # Display weather
+        # The data is fixed until the next fetch, so the frame is drawn
+        # exactly once; re-showing it on stray keys would cost a full
+        # ~2s panel flash for identical content
+        lines = self._build_lines(weather_data)
+
+        image, fg = self.create_image()
+        _, bg = self.display.get_colors()
+        self.blit_lines(image, lines, fg, bg)
+        self.display.show(image)
+
+        # Wait for ESC
         while True:
-            image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                fnt_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-            except:
-                fnt_title = fnt = ImageFont.load_default()
-            
-            # Parse weather data
-            current = weather_data['current_condition'][0]
-            today = weather_data['weather'][0]
-            
-            # Title with location
-            location_data = weather_data['nearest_area'][0]
-            city = location_data.get('areaName', [{}])[0].get('value', '')
-            state = location_data.get('region', [{}])[0].get('value', '')
-            
-            # Wrap location text if too long
-            location_text = f"{city}, {state}" if state else city
-            if len(location_text) > 25:
-                location_text = location_text[:22] + "..."
-            
-            draw.text((5, 2), location_text, font=fnt_title, fill=fg)
-            
-            # Current conditions
-            temp_f = current['temp_F']
-            feels_like = current['FeelsLikeF']
-            condition = current['weatherDesc'][0]['value']
-            humidity = current['humidity']
-            wind_mph = current['windspeedMiles']
-            
-            y = 18
-            draw.text((5, y), f"Now: {temp_f}F (feels {feels_like}F)", font=fnt, fill=fg)
+            if self.keyboard.wait_key() == 'ESC':
+                return 'main_menu'
+
+    def _build_lines(self, weather_data):
+        """Format the fetched data into (x, y, text, font, size) lines
+
+        Every field is pulled through .get chains so a partial wttr.in
+        response degrades to placeholder text instead of a KeyError.
+        """
+        current = (weather_data.get('current_condition') or [{}])[0]
+        forecast = weather_data.get('weather') or [{}]
+        today = forecast[0]
+
+        # Title with location
+        location_data = (weather_data.get('nearest_area') or [{}])[0]
+        city = (location_data.get('areaName') or [{}])[0].get('value', '')
+        state = (location_data.get('region') or [{}])[0].get('value', '')
+
+        # Wrap location text if too long
+        location_text = f"{city}, {state}" if state else city
+        if len(location_text) > 25:
+            location_text = location_text[:22] + "..."
+
+        # Current conditions
+        temp_f = current.get('temp_F', '?')
+        feels_like = current.get('FeelsLikeF', '?')
+        condition = (current.get('weatherDesc') or [{}])[0].get('value', '')
+        humidity = current.get('humidity', '?')
+        wind_mph = current.get('windspeedMiles', '?')
+
+        lines = [(5, 2, location_text, _BOLD_FONT, 14)]
+
+        y = 18
+        lines.append((5, y, f"Now: {temp_f}F (feels {feels_like}F)", _REGULAR_FONT, 10))
+        y += 12
+
+        # Wrap condition text if too long
+        if len(condition) > 35:
+            # Split into two lines
+            words = condition.split()
+            line1 = ""
+            line2 = ""
+            for word in words:
+                if len(line1 + word) < 35:
+                    line1 += word + " "
+                else:
+                    line2 += word + " "
+            lines.append((5, y, line1.strip(), _REGULAR_FONT, 10))
             y += 12
-            
-            # Wrap condition text if too long
-            if len(condition) > 35:
-                # Split into two lines
-                words = condition.split()
-                line1 = ""
-                line2 = ""
-                for word in words:
-                    if len(line1 + word) < 35:
-                        line1 += word + " "
-                    else:
-                        line2 += word + " "
-                draw.text((5, y), line1.strip(), font=fnt, fill=fg)
-                y += 12
-                if line2:
-                    draw.text((5, y), line2.strip(), font=fnt, fill=fg)
-                    y += 12
-            else:
-                draw.text((5, y), condition, font=fnt, fill=fg)
+            if line2:
+                lines.append((5, y, line2.strip(), _REGULAR_FONT, 10))
                 y += 12
-            
-            draw.text((5, y), f"Humidity: {humidity}%", font=fnt, fill=fg)
+        else:
+            lines.append((5, y, condition, _REGULAR_FONT, 10))
             y += 12
-            draw.text((5, y), f"Wind: {wind_mph} mph", font=fnt, fill=fg)
-            
-            # Today's forecast
-            y += 14
-            high = today['maxtempF']
-            low = today['mintempF']
-            draw.text((5, y), f"Today: {high}F/{low}F", font=fnt, fill=fg)
-            
-            # Tomorrow's forecast if space allows
-            if len(weather_data['weather']) > 1 and y < 90:
-                tomorrow = weather_data['weather'][1]
-                y += 12
-                tom_high = tomorrow['maxtempF']
-                tom_low = tomorrow['mintempF']
-                draw.text((5, y), f"Tomorrow: {tom_high}F/{tom_low}F", font=fnt, fill=fg)
-            
-            draw.text((5, 108), "ESC=Back", font=fnt, fill=fg)
-            
-            self.display.show(image)
-            
-            # Wait for ESC
-            key = self.keyboard.get_key()
-            if key == 'ESC':
-                return 'main_menu'
-            time.sleep(0.1)
+
+        lines.append((5, y, f"Humidity: {humidity}%", _REGULAR_FONT, 10))
+        y += 12
+        lines.append((5, y, f"Wind: {wind_mph} mph", _REGULAR_FONT, 10))
+
+        # Today's forecast
+        y += 14
+        high = today.get('maxtempF', '?')
+        low = today.get('mintempF', '?')
+        lines.append((5, y, f"Today: {high}F/{low}F", _REGULAR_FONT, 10))
+
+        # Tomorrow's forecast if space allows
+        if len(forecast) > 1 and y < 90:
+            tomorrow = forecast[1]
+            y += 12
+            tom_high = tomorrow.get('maxtempF', '?')
+            tom_low = tomorrow.get('mintempF', '?')
+            lines.append((5, y, f"Tomorrow: {tom_high}F/{tom_low}F", _REGULAR_FONT, 10))
+
+        lines.append((5, 108, "ESC=Back", _REGULAR_FONT, 10))
+        return lines
 
 
 class SystemMonitorApp(App):
@@ -1298,13 +1872,10 @@ class SystemMonitorApp(App):
         """Display system information"""
         while True:
             image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
+            draw = self._draw
             
-            try:
-                fnt_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-            except:
-                fnt_title = fnt = ImageFont.load_default()
+            fnt_title = _font(_BOLD_FONT, 14)
+            fnt = _font(_REGULAR_FONT, 10)
             
             # Title
             self.draw_text_centered(draw, "SYSTEM MONITOR", 2, None, 14, fg)
@@ -1344,13 +1915,10 @@ class SystemMonitorApp(App):
             
             self.display.show(image, partial=True)
             
-            # Check for ESC to exit, otherwise update every 2 seconds
-            start_time = time.time()
-            while time.time() - start_time < 2:
-                key = self.keyboard.get_key()
-                if key == 'ESC':
-                    return 'main_menu'
-                time.sleep(0.1)
+            # Block until a key arrives or it's time for the 2s refresh
+            key = self.keyboard.wait_key(timeout=2)
+            if key == 'ESC':
+                return 'main_menu'
 
 
 class SettingsApp(App):
@@ -1369,33 +1937,28 @@ class SettingsApp(App):
             'Display Info',
             'Factory Reset'
         ]
-    
-    def draw_menu(self):
-        """Draw settings menu"""
-        image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
-        
-        self.draw_text_centered(draw, "SETTINGS", 2, None, 14, fg)
-        
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-        except:
-            fnt = ImageFont.load_default()
-        
-        # Show settings with current values
-        start_idx = max(0, self.selected - 4)
-        end_idx = min(len(self.options), start_idx + 6)
-        
-        for i in range(start_idx, end_idx):
-            y = 20 + (i - start_idx) * 15
-            
-            # Highlight selected
-            prefix = '>' if i == self.selected else ' '
-            
-            # Get current value
-            option = self.options[i]
+
+        # Static menu chrome rendered lazily per foreground color
+        self._menu_bg = None
+        self._menu_bg_fg = None
+        self._drawn = False
+        # Row strings only change in toggle_setting, not per keypress
+        self._row_texts = None
+        # Fixed info strings for show_display_info
+        self._res_text = f"Resolution: {display.width}x{display.height}"
+        self._mode_text = f"Display: {'Demo Mode' if display.demo_mode else 'Hardware Mode'}"
+
+    def reset(self):
+        """Start from the first option with a full first paint"""
+        self.selected = 0
+        self._drawn = False
+
+    def _build_row_texts(self):
+        """Format the 'n. Option: value' string for every option"""
+        rows = []
+        for i, option in enumerate(self.options):
             value = ""
-            
+
             if option == 'Dark/Light Mode':
                 value = "Dark" if self.settings_manager.get_setting('dark_mode', True) else "Light"
             elif option == 'Clock Format':
@@ -1412,15 +1975,54 @@ class SettingsApp(App):
             elif option == 'ZIP Code':
                 zip_code = self.settings_manager.get_setting('zip_code', '')
                 value = zip_code if zip_code else "Not Set"
-            
-            text = f"{prefix}{i+1}. {option}: {value}"
+
+            rows.append(f"{i+1}. {option}: {value}")
+        return rows
+
+    def _build_menu_bg(self, fg, bg):
+        """Render the static chrome (title + footer) once"""
+        image = Image.new('1', (self.display.width, self.display.height), bg)
+        draw = ImageDraw.Draw(image)
+        self.draw_text_centered(draw, "SETTINGS", 2, None, 14, fg)
+        fnt = _font(_REGULAR_FONT, 10)
+        draw.text((5, 108), "ENTER=Edit ESC=Back", font=fnt, fill=fg)
+        return image
+
+    def draw_menu(self):
+        """Draw settings menu: paste the static chrome, add the rows"""
+        fg, bg = self.display.get_colors()
+
+        if self._menu_bg is None or self._menu_bg_fg != fg:
+            self._menu_bg = self._build_menu_bg(fg, bg)
+            self._menu_bg_fg = fg
+
+        self._canvas.paste(self._menu_bg, (0, 0))
+        image = self._canvas
+
+        if self._row_texts is None:
+            self._row_texts = self._build_row_texts()
+
+        # Show settings with current values
+        start_idx = max(0, self.selected - 4)
+        end_idx = min(len(self.options), start_idx + 6)
+
+        for i in range(start_idx, end_idx):
+            y = 20 + (i - start_idx) * 15
+
+            # Highlight selected
+            prefix = '>' if i == self.selected else ' '
+
+            text = prefix + self._row_texts[i]
             if len(text) > 38:
                 text = text[:35] + "..."
-            draw.text((5, y), text, font=fnt, fill=fg)
-        
-        draw.text((5, 108), "ENTER=Edit ESC=Back", font=fnt, fill=fg)
-        
-        self.display.show(image)
+            # Rows repeat across redraws, so blit cached text tiles
+            # instead of re-rasterizing each line
+            image.paste(_text_tile(text, _REGULAR_FONT, 10, fg, bg), (5, y))
+
+        # First paint is a full refresh; navigation updates are partial
+        # (fast, no flash)
+        self.display.show(image, partial=self._drawn)
+        self._drawn = True
     
     def toggle_setting(self, setting_name):
         """Toggle or edit a setting"""
@@ -1462,95 +2064,86 @@ class SettingsApp(App):
         
         elif setting_name == 'Display Info':
             self.show_display_info()
-        
+
         elif setting_name == 'Factory Reset':
             self.factory_reset()
+
+        # Values may have changed - rebuild the row strings on next draw
+        self._row_texts = None
     
     def get_text_input(self, prompt, max_length=50):
         """Get text input from keyboard"""
-        text = ""
-        
+        chars = []
+        fnt = _font(_REGULAR_FONT, 12)
+
+        # Prompt and bottom instructions never change while typing -
+        # render them once into a static base frame
+        image, fg = self.create_image()
+        self._draw.text((5, 5), prompt, font=fnt, fill=fg)
+        self._draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
+        self._draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
+        base = image.copy()
+
         while True:
-            image, fg = self.create_image()
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except:
-                fnt = ImageFont.load_default()
-            
-            draw.text((5, 5), prompt, font=fnt, fill=fg)
-            display_text = text + "_"
-            draw.text((5, 30), display_text, font=fnt, fill=fg)
-            draw.text((5, 105), "ENTER=Done", font=fnt, fill=fg)
-            draw.text((165, 105), "ESC=Cancel", font=fnt, fill=fg)
-            
-            self.display.show(image)
-            
-            while True:
-                key = self.keyboard.get_key()
-                if key:
-                    break
-                time.sleep(0.05)
-            
+            # Only the input line changes per keystroke
+            self._canvas.paste(base, (0, 0))
+            self._draw.text((5, 30), ''.join(chars) + "_", font=fnt, fill=fg)
+
+            # Use partial refresh for faster typing
+            self.display.show(self._canvas, partial=True)
+
+            # Wait for key
+            key = self.keyboard.wait_key()
+
             if key == 'ENTER':
-                return text
+                return ''.join(chars)
             elif key == 'ESC':
                 return None
-            elif key == 'BACKSPACE' and len(text) > 0:
-                text = text[:-1]
-            elif key and len(key) == 1 and len(text) < max_length:
-                text += key
+            elif key == 'BACKSPACE' and chars:
+                chars.pop()
+            elif key and len(key) == 1 and len(chars) < max_length:
+                chars.append(key)
     
     def show_display_info(self):
         """Show system information"""
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
+        draw = self._draw
         
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-        except:
-            fnt = ImageFont.load_default()
+        fnt = _font(_REGULAR_FONT, 10)
         
         self.draw_text_centered(draw, "DISPLAY INFO", 2, None, 14, fg)
         
         y = 25
         # Resolution
-        draw.text((5, y), f"Resolution: {self.display.width}x{self.display.height}", font=fnt, fill=fg)
+        draw.text((5, y), self._res_text, font=fnt, fill=fg)
         y += 15
-        
+
         # Number of notes
         note_count = len(self.notes_manager.get_notes())
         draw.text((5, y), f"Notes Saved: {note_count}", font=fnt, fill=fg)
         y += 15
-        
+
         # Demo mode
-        mode = "Demo Mode" if self.display.demo_mode else "Hardware Mode"
-        draw.text((5, y), f"Display: {mode}", font=fnt, fill=fg)
+        draw.text((5, y), self._mode_text, font=fnt, fill=fg)
         y += 15
-        
+
         # Uptime (simplified)
-        draw.text((5, y), f"Python: {sys.version.split()[0]}", font=fnt, fill=fg)
+        draw.text((5, y), f"Python: {_PY_VERSION}", font=fnt, fill=fg)
         
         draw.text((5, 108), "ESC=Back", font=fnt, fill=fg)
         
         self.display.show(image)
         
         while True:
-            key = self.keyboard.get_key()
-            if key == 'ESC':
+            if self.keyboard.wait_key() == 'ESC':
                 return
-            time.sleep(0.1)
     
     def factory_reset(self):
         """Confirm and perform factory reset"""
         image, fg = self.create_image()
-        draw = ImageDraw.Draw(image)
+        draw = self._draw
         
-        try:
-            fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-        except:
-            fnt = ImageFont.load_default()
+        fnt = _font(_REGULAR_FONT, 11)
         
         self.draw_text_centered(draw, "FACTORY RESET?", 20, None, 14, fg)
         draw.text((15, 50), "This will delete ALL notes", font=fnt, fill=fg)
@@ -1561,51 +2154,28 @@ class SettingsApp(App):
         self.display.show(image)
         
         while True:
-            key = self.keyboard.get_key()
+            key = self.keyboard.wait_key()
             if key == 'ENTER':
                 # Perform reset
-                self.notes_manager.notes = []
-                self.notes_manager._save_notes()
+                self.notes_manager.delete_all()
                 self.settings_manager.reset_to_defaults()
                 
                 # Show confirmation
                 image, fg = self.create_image()
-                draw = ImageDraw.Draw(image)
+                draw = self._draw
                 self.draw_text_centered(draw, "Reset Complete!", 50, None, 14, fg)
                 self.display.show(image)
                 time.sleep(2)
                 return
             elif key == 'ESC':
                 return
-            time.sleep(0.1)
     
     def run(self):
         """Settings menu loop"""
-        self.draw_menu()
-        
-        while self.running:
-            key = self.keyboard.get_key()
-            
-            if not key:
-                time.sleep(0.1)
-                continue
-            
-            if key == 'w' and self.selected > 0:
-                self.selected -= 1
-                self.draw_menu()
-            elif key == 's' and self.selected < len(self.options) - 1:
-                self.selected += 1
-                self.draw_menu()
-            elif key.isdigit():
-                num = int(key)
-                if 1 <= num <= len(self.options):
-                    self.selected = num - 1
-                    self.draw_menu()
-            elif key == 'ENTER':
-                self.toggle_setting(self.options[self.selected])
-                self.draw_menu()
-            elif key == 'ESC':
-                return 'main_menu'
+        return self._nav_loop(
+            lambda: len(self.options), self.draw_menu,
+            lambda: self.toggle_setting(self.options[self.selected]),
+            'main_menu')
 
 
 def main():
@@ -1619,36 +2189,28 @@ def main():
     keyboard = KeyboardInput()
     notes_manager = NotesManager()
     
+    # Instantiate each app once; reset() clears per-session state on entry
+    args = (display, keyboard, notes_manager, settings_manager)
+    apps = {
+        'clock': ClockApp(*args),
+        'main_menu': MainMenuApp(*args),
+        'notes_menu': NotesMenuApp(*args),
+        'create_note': CreateNoteApp(*args),
+        'view_notes': ViewNotesApp(*args),
+        'weather': WeatherApp(*args),
+        'system_monitor': SystemMonitorApp(*args),
+        'settings': SettingsApp(*args),
+    }
+
     # Start with clock
     current_app = 'clock'
-    
+
     try:
         while True:
-            if current_app == 'clock':
-                app = ClockApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'main_menu':
-                app = MainMenuApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'notes_menu':
-                app = NotesMenuApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'create_note':
-                app = CreateNoteApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'view_notes':
-                app = ViewNotesApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'weather':
-                app = WeatherApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'system_monitor':
-                app = SystemMonitorApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            elif current_app == 'settings':
-                app = SettingsApp(display, keyboard, notes_manager, settings_manager)
-                current_app = app.run()
-            
+            app = apps[current_app]
+            app.reset()
+            current_app = app.run()
+
             # Small delay between app transitions
             time.sleep(0.1)
     
@@ -1656,6 +2218,7 @@ def main():
         print("\nShutting down...")
     finally:
         keyboard.stop()
+        notes_manager.flush()
         display.sleep()
         print("Goodbye!")
 